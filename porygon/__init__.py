@@ -0,0 +1,53 @@
+import os
+import hashlib
+import logging
+from pathlib import Path
+import orjson
+import discord
+from discord.ext import commands
+
+# each feature is an extension; BOT_EXTENSIONS="roll,mission" loads a subset
+EXTENSIONS = ("porygon.roll", "porygon.mission", "porygon.webhook")
+
+SYNC_HASH_FILE = Path(__file__).resolve().parent.parent / ".sync_hash"
+
+class PorygonBot(commands.Bot):
+    def __init__(self):
+        intents = discord.Intents.default()
+        intents.message_content = True
+        super().__init__(command_prefix="!", intents=intents)
+        self._synced = False
+
+    async def setup_hook(self):
+        enabled = os.getenv("BOT_EXTENSIONS")
+        wanted = {name.strip() for name in enabled.split(",")} if enabled else None
+        for ext in EXTENSIONS:
+            if wanted is None or ext.rpartition(".")[2] in wanted:
+                await self.load_extension(ext)
+
+    async def on_ready(self):
+        logging.info("✅ Logged in as %s (id=%s)", self.user, self.user.id)
+        # reconnects fire on_ready again; the tree only needs syncing once
+        if not self._synced:
+            try:
+                await self._sync_commands()
+                self._synced = True
+            except Exception as e:
+                logging.exception("Slash sync failed: %s", e)
+
+    async def _sync_commands(self):
+        # skip the sync HTTP call when the local tree matches the last synced one
+        payload = [self.application_id, [c.to_dict(self.tree) for c in self.tree.get_commands()]]
+        digest = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        try:
+            if SYNC_HASH_FILE.read_text().strip() == digest:
+                logging.info("Slash commands unchanged, skipping sync")
+                return
+        except OSError:
+            pass
+        synced = await self.tree.sync()
+        logging.info("Slash commands synced: %d", len(synced))
+        try:
+            SYNC_HASH_FILE.write_text(digest)
+        except OSError:
+            logging.warning("Could not write %s; will sync again next start", SYNC_HASH_FILE)
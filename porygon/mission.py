@@ -0,0 +1,127 @@
+import os
+import re
+import signal
+import asyncio
+import functools
+import logging
+from pathlib import Path
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+MEDIA_DIR = Path(__file__).resolve().parent.parent / "media"
+# If you want a whitelist, map ids to base names here:
+# MISSIONS = {"001": "mission001.mp4", "002": "mission002.mp4"}
+# For now we auto-discover by id (mission###.*), indexed when the cog loads
+
+_NONDIGIT = re.compile(r"\D")
+# prefix only: any extension, including multi-part ones, still resolves
+_MISSION_FILE_RE = re.compile(r"mission(\d{3,4})\.")
+
+@functools.lru_cache(maxsize=256)
+def _normalize_id(raw: str) -> str:
+    # accept "1", "01", "001" -> "001"; only digits, max 4 just to be safe
+    digits = _NONDIGIT.sub("", raw)[:4]
+    if not digits:
+        raise ValueError("ID inválido. Usa `!mission 001` por exemplo.")
+    return digits.zfill(3)
+
+def _build_mission_index() -> dict[str, Path]:
+    # one scandir pass over media/; dirents carry their type, so no extra stat
+    index: dict[str, Path] = {}
+    with os.scandir(MEDIA_DIR) as it:
+        for entry in it:
+            m = _MISSION_FILE_RE.match(entry.name)
+            if not m or not entry.is_file():
+                continue
+            path = Path(entry.path)
+            # prefer mp4 if multiple
+            cur = index.get(m.group(1))
+            if cur is None or (path.suffix != ".mp4", path.name) < (cur.suffix != ".mp4", cur.name):
+                index[m.group(1)] = path
+    logging.info("Mission index built: %d missions", len(index))
+    return index
+
+class Mission(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.index: dict[str, Path] = {}
+
+    async def cog_load(self):
+        try:
+            self.reload_index()
+        except OSError:
+            logging.exception("Failed to index %s", MEDIA_DIR)
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload_index)
+        except (NotImplementedError, AttributeError):  # Windows
+            pass
+
+    async def cog_unload(self):
+        try:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        except (NotImplementedError, AttributeError):
+            pass
+
+    def reload_index(self) -> None:
+        self.index = _build_mission_index()
+
+    def find_file(self, mission_id: str) -> Path:
+        try:
+            return self.index[mission_id]
+        except KeyError:
+            raise FileNotFoundError(f"Missão {mission_id} não encontrada em `{MEDIA_DIR}`.") from None
+
+    @commands.command(name="mission")
+    async def mission_cmd(self, ctx, mission_id: str):
+        """Ex.: !mission 001  -> envia media/mission001.mp4 (ou o que existir)"""
+        try:
+            mid = _normalize_id(mission_id)
+            path = self.find_file(mid)
+        except Exception as e:
+            await ctx.send(str(e))
+            return
+
+        # Discord size limits apply. This will fail if the file is too large.
+        # open off the event loop; aiohttp already reads file payloads in a thread
+        name = path.name
+        fp = await asyncio.to_thread(open, path, "rb")
+        try:
+            await ctx.send(file=discord.File(fp=fp, filename=name))
+        except discord.HTTPException as e:
+            await ctx.send(f"Falha ao enviar `{name}` ({e}). "
+                           f"Arquivo pode ser grande demais. Considera enviar um link/CDN.")
+        finally:
+            fp.close()
+
+    @commands.command(name="missions_reload")
+    @commands.has_permissions(administrator=True)
+    async def missions_reload_cmd(self, ctx):
+        """Relê media/ depois de adicionar ou remover missões"""
+        self.reload_index()
+        await ctx.send(f"Missões recarregadas: {len(self.index)}.")
+
+    # Slash version
+    @app_commands.command(name="mission", description="Enviar a missão (ex.: 001)")
+    async def mission_slash(self, interaction: discord.Interaction, mission_id: str):
+        try:
+            mid = _normalize_id(mission_id)
+            path = self.find_file(mid)
+        except Exception as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
+
+        # respond + attach
+        await interaction.response.send_message(f"Missão {mid}:")
+        name = path.name
+        fp = await asyncio.to_thread(open, path, "rb")
+        try:
+            await interaction.followup.send(file=discord.File(fp=fp, filename=name))
+        except discord.HTTPException as e:
+            await interaction.followup.send(f"Falha ao enviar `{name}` ({e}). "
+                                            f"Arquivo pode ser grande demais.")
+        finally:
+            fp.close()
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Mission(bot))
@@ -0,0 +1,122 @@
+import re
+import numpy as np
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+# ---- roll core -------------------------------------------------------------
+ROLL_RE = re.compile(
+    r"""
+    ^\s*
+    (?P<n>\d{1,4})          # number of dice
+    [dD]
+    (?P<sides>\d{1,5})      # sides per die
+    (?:\s*
+       (?P<op>[+\-])        # optional + or -
+       \s*
+       (?P<mod>\d{1,6})     # modifier
+    )?
+    \s*$
+    """,
+    re.VERBOSE,
+)
+
+MAX_DICE = 500
+MAX_SIDES = 1000
+
+_RNG = np.random.default_rng()
+
+# separators of the roll message; _MSG_RE splits on them to chunk long rolls
+_ROLAGEM_SEP = " Rolagem: "
+_RESULT_SEP = " Resultado: "
+_MSG_RE = re.compile(r"^(?P<hdr>.*?) Rolagem: (?P<rolls>.*) Resultado: (?P<res>-?\d+)$", re.S)
+
+# modifier sign per operator; no operator means no modifier
+_OP_SIGN = {"+": 1, "-": -1, None: 0}
+
+def parse_and_roll(expr: str):
+    m = ROLL_RE.match(expr)
+    if not m:
+        raise ValueError("Formato inválido. Usa algo como `6d6 + 2` ou `3d20`.")
+
+    g = m.group
+    n = int(g("n"))
+    sides = int(g("sides"))
+    op = g("op")
+    mod = g("mod")
+    mod = int(mod) if mod else 0
+
+    if not 1 <= n <= MAX_DICE:
+        raise ValueError(f"Quantidade de dados inválida (1–{MAX_DICE}).")
+    if not 2 <= sides <= MAX_SIDES:
+        raise ValueError(f"Lados inválidos (2–{MAX_SIDES}).")
+
+    # sides <= MAX_SIDES fits in 16 bits, so numpy uses Lemire's bounded
+    # method on buffered 16-bit draws: two dice per 32-bit PRNG output
+    arr = _RNG.integers(1, sides + 1, size=n, dtype=np.uint16)
+    total = int(arr.sum(dtype=np.int64)) + _OP_SIGN[op] * mod
+
+    # Build the exact display strings
+    spec = f"{n}d{sides}"
+    if op and mod:
+        spec += f" {op} {mod}"
+
+    # tolist() hands back Python ints in one call; map(str) over them beat
+    # numpy's int->str casts, which still build a str per element
+    rolls_body = ", ".join(map(str, arr.tolist()))
+
+    # Inline-code bracket blocks like your screenshots, assembled in one pass
+    msg = "".join([
+        "`[", spec, "]`", _ROLAGEM_SEP,
+        "`[", rolls_body, "]`", _RESULT_SEP,
+        str(total),
+    ])
+    return msg
+
+def split_roll_msg(msg: str, chunk: int = 1700) -> list[str]:
+    # Discord message size guard: short rolls go out as-is, long ones keep
+    # the exact look but split into header, chunked rolls block and result
+    if len(msg) <= 1900:
+        return [msg]
+    m = _MSG_RE.match(msg)
+    if not m:
+        # unknown format: send as-is after whatever header we can find
+        return [msg.partition(_ROLAGEM_SEP)[0], msg]
+    rolls_part = m["rolls"]
+    # plain str slices: send() needs str, so a bytes/memoryview buffer would
+    # still allocate one decoded str per chunk, plus the encode up front
+    chunks = [rolls_part[i:i + chunk] for i in range(0, len(rolls_part), chunk)]
+    return [m["hdr"], *chunks, "Resultado: " + m["res"]]
+
+# ---- commands --------------------------------------------------------------
+class Roll(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.command(name="roll")
+    async def roll_cmd(self, ctx, *, expression: str):
+        try:
+            msg = parse_and_roll(expression)
+        except ValueError as e:
+            await ctx.send(str(e))
+            return
+
+        for part in split_roll_msg(msg):
+            await ctx.send(part)
+
+    # slash command mirror
+    @app_commands.command(name="roll", description="Rolar dados. Ex: 6d6 + 2 ou 3d20")
+    async def roll_slash(self, interaction: discord.Interaction, expression: str):
+        try:
+            msg = parse_and_roll(expression)
+        except ValueError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
+
+        first, *rest = split_roll_msg(msg)
+        await interaction.response.send_message(first)
+        for part in rest:
+            await interaction.channel.send(part)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Roll(bot))
@@ -0,0 +1,160 @@
+import os
+import re
+import hmac
+import asyncio
+import functools
+import logging
+from aiohttp import web
+import orjson
+import discord
+from discord.ext import commands
+
+from porygon.roll import parse_and_roll, split_roll_msg
+
+# ---- webhook HTTP server ----------------------------------------------------
+WEBHOOK_TOKEN = os.getenv("WEBHOOK_TOKEN")
+_WEBHOOK_TOKEN_B = WEBHOOK_TOKEN.encode() if WEBHOOK_TOKEN else None
+_BEARER_RE = re.compile(r"^\s*bearer\s+(\S+)\s*$", re.IGNORECASE)
+
+# constant bodies are encoded once; a Response is still built per request,
+# since aiohttp binds a prepared response to the request it was sent on
+_OK = orjson.dumps({"ok": True})
+_ERR_METHOD = orjson.dumps({"error": "method not allowed"})
+_ERR_JSON = orjson.dumps({"error": "invalid json"})
+_ERR_UNAUTHORIZED = orjson.dumps({"error": "unauthorized"})
+_ERR_MISSING = orjson.dumps({"error": "channel_id and expression are required"})
+_ERR_MISSING_HEADER = orjson.dumps({"error": "channel_id, expression and message are required"})
+_ERR_CHANNEL_ID = orjson.dumps({"error": "channel_id must be an integer"})
+_ERR_CHANNEL = orjson.dumps({"error": "channel not found or inaccessible"})
+
+def _raw(body: bytes, status: int = 200) -> web.Response:
+    return web.Response(body=body, status=status, content_type="application/json")
+
+def _json(obj, status: int = 200) -> web.Response:
+    return _raw(orjson.dumps(obj), status)
+
+def _extract_bearer_token(request: web.Request) -> str | None:
+    auth = request.headers.get("Authorization")
+    if not auth:
+        return None
+    m = _BEARER_RE.match(auth)
+    return m.group(1) if m else None
+
+async def _send_roll_to_channel(channel: discord.abc.Messageable, msg: str, header: str | None = None, *, combine: bool = False):
+    # optional header line
+    if header and combine:
+        combined = f"{header}\n{msg}"
+        if len(combined) <= 1900:
+            await channel.send(combined)
+            return
+        # if combined too long, fall back to header + chunked roll
+        await channel.send(header[:1900])
+    elif header:
+        if len(header) > 1900:
+            header = header[:1900]
+        await channel.send(header)
+
+    for part in split_roll_msg(msg):
+        await channel.send(part)
+
+class Webhook(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.ready = asyncio.Event()
+        self.runner: web.AppRunner | None = None
+
+    async def cog_load(self):
+        # listen as soon as the extension loads, before the gateway connects;
+        # handlers wait on self.ready, so early requests just queue
+        try:
+            await self.start_server()
+        except Exception:
+            logging.exception("Failed to start webhook server")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # mark bot ready
+        self.ready.set()
+
+    async def cog_unload(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    async def start_server(self):
+        app = web.Application()
+        app.add_routes([
+            web.post("/webhook/roll", functools.partial(self._handle, require_header=False)),
+            web.post("/webhook/rollmessage", functools.partial(self._handle, require_header=True)),
+            web.get("/", lambda request: _json({
+                "ok": True,
+                "service": "porygon-bot",
+                "features": ["roll", "rollmessage", "header", "bearer_auth", "combine"],
+            })),
+        ])
+        runner = web.AppRunner(app)
+        await runner.setup()
+        port = int(os.getenv("PORT", "8080"))
+        site = web.TCPSite(runner, host="0.0.0.0", port=port)
+        await site.start()
+        self.runner = runner
+        logging.info("🌐 Webhook server running on 0.0.0.0:%s", port)
+
+    async def _handle(self, request: web.Request, *, require_header: bool) -> web.StreamResponse:
+        if request.method != "POST":
+            return _raw(_ERR_METHOD, 405)
+        try:
+            data = orjson.loads(await request.read())
+        except Exception:
+            return _raw(_ERR_JSON, 400)
+
+        token = str(data.get("token", "")) or _extract_bearer_token(request) or ""
+        # aiohttp decodes headers with surrogateescape; round-trip the raw bytes
+        # so a non-UTF-8 bearer token is rejected instead of raising
+        if _WEBHOOK_TOKEN_B and not hmac.compare_digest(token.encode("utf-8", "surrogateescape"), _WEBHOOK_TOKEN_B):
+            return _raw(_ERR_UNAUTHORIZED, 401)
+
+        channel_id = data.get("channel_id")
+        expression = data.get("expression")
+        header_message = data.get("message")  # optional header line (required for /rollmessage)
+        combine = bool(data.get("combine", False))  # optional: send as one message
+        if require_header:
+            if not channel_id or not expression or not header_message:
+                return _raw(_ERR_MISSING_HEADER, 400)
+        elif not channel_id or not expression:
+            return _raw(_ERR_MISSING, 400)
+
+        try:
+            cid = int(channel_id)
+        except (TypeError, ValueError):
+            return _raw(_ERR_CHANNEL_ID, 400)
+
+        # wait for bot readiness
+        await self.ready.wait()
+
+        # resolve channel (cache or fetch)
+        channel = self.bot.get_channel(cid)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(cid)
+            except Exception:
+                logging.exception("Failed to fetch channel %s", cid)
+                return _raw(_ERR_CHANNEL, 404)
+
+        # build message using existing roller
+        try:
+            msg = parse_and_roll(str(expression))
+        except ValueError as e:
+            return _json({"error": str(e)}, 400)
+
+        # send, with same size-guard behavior as commands
+        try:
+            await _send_roll_to_channel(channel, msg, header_message, combine=combine)
+        except discord.HTTPException as e:
+            logging.exception("Discord send failed")
+            return _json({"error": f"discord error: {e}"}, 502)
+
+        return _raw(_OK)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Webhook(bot))